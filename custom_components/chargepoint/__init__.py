@@ -3,17 +3,23 @@ Custom integration to integrate ChargePoint with Home Assistant.
 
 """
 import os
+import sys
 import json
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Optional
+from functools import lru_cache
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, CONF_ACCESS_TOKEN
 from homeassistant.exceptions import ConfigEntryNotReady, ConfigEntryAuthFailed
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity import DeviceInfo, EntityDescription
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -46,30 +52,147 @@ from .const import (
     ACCT_HOME_CRGS,
     DATA_CLIENT,
     DATA_COORDINATOR,
+    DATA_TOKEN_CACHE,
+    DATA_PENDING_CLIENTS,
+    CREDENTIAL_CACHE_TTL,
     TOKEN_FILE_NAME,
+    OPTION_POLL_INTERVAL,
+    OPTION_ADAPTIVE_POLLING,
+    POLL_INTERVAL_DEFAULT,
+    POLL_INTERVAL_MIN,
+    POLL_INTERVAL_MAX,
+    POLL_INTERVAL_IDLE,
+    API_MAX_RATE,
+    API_RATE_PERIOD,
+    API_RETRY_ATTEMPTS,
+    API_TIMEOUT,
+    EXECUTOR_MAX_WORKERS,
+    DATA_EXECUTOR,
+    DATA_LIMITER,
 )
 
 SCAN_INTERVAL = timedelta(minutes=5)
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Serializes read-modify-write cycles on the shared session token file.
+_SESSION_FILE_LOCK = threading.Lock()
+
+# (name, unique_id) per (charger_id, short model, description key), kept across
+# reloads. The model is part of the key so a cached name can never go stale.
+ENTITY_NAME_CACHE: Dict[Tuple[int, str, str], Tuple[str, str]] = {}
+
+
+@dataclass(frozen=True)
+class ChargerDerivedInfo:
+    """Display strings and options derived from a home charger's status."""
+
+    manufacturer: str
+    short_model: str
+    device_name: str
+    amperage_options: Tuple[str, ...]
+
+
+@lru_cache(maxsize=64)
+def derive_charger_info(
+    brand: Optional[str], model: str, amperage_limits: Tuple[int, ...]
+) -> ChargerDerivedInfo:
+    """Derive display strings for a charger, shared by chargers of the same model."""
+    manufacturer = "ChargePoint" if brand == "CP" else brand
+    short_model = model.split("-")[0]
+    device_name = (
+        f"{manufacturer} Home Flex ({short_model})"
+        if "CPH" in short_model
+        else f"{manufacturer} {short_model}"
+    )
+    amperage_options = tuple(str(limit) for limit in amperage_limits)
+    return ChargerDerivedInfo(manufacturer, short_model, device_name, amperage_options)
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key."""
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def call(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await func(), or the matching call that is already running."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so a cancelled caller doesn't cancel the call for everyone else.
+        return await asyncio.shield(future)
+
+
+class RateLimiter:
+    """Async context manager allowing at most max_rate entries per time_period."""
+
+    def __init__(self, max_rate: int, time_period: float) -> None:
+        self._semaphore = asyncio.Semaphore(max_rate)
+        self._time_period = time_period
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+        # Each slot is handed back once the period has passed, not on exit.
+        asyncio.get_running_loop().call_later(
+            self._time_period, self._semaphore.release
+        )
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
 
 def persist_session_token(
     hass: HomeAssistant, entry: ConfigEntry, session_token: str
 ) -> None:
     config_dir = hass.config.config_dir
     file = os.path.join(config_dir, TOKEN_FILE_NAME)
-    session_dict = {}
-    if os.path.isfile(file):
-        with open(file, "r") as spf:
-            try:
-                session_dict = json.load(spf)
-            except json.decoder.JSONDecodeError:
-                _LOGGER.error("Failed to load existing session data, overwriting!")
-    _LOGGER.info("Persisting session token to %s", file)
-    session_dict[entry.entry_id] = session_token
-    with open(os.open(file, os.O_CREAT | os.O_WRONLY, 0o600), "w") as spf:
-        json.dump(session_dict, spf)
+    # Entries share the file and the temp path, so writers take turns.
+    with _SESSION_FILE_LOCK:
+        session_dict = {}
+        if os.path.isfile(file):
+            with open(file, "r") as spf:
+                try:
+                    session_dict = json.load(spf)
+                except json.decoder.JSONDecodeError:
+                    _LOGGER.error("Failed to load existing session data, overwriting!")
+        _LOGGER.info("Persisting session token to %s", file)
+        session_dict[entry.entry_id] = session_token
+        # Write to a temporary file and swap it in so readers never see torn JSON.
+        tmp_file = f"{file}.tmp"
+        flags = os.O_CREAT | os.O_WRONLY | os.O_TRUNC
+        with open(os.open(tmp_file, flags, 0o600), "w") as spf:
+            json.dump(session_dict, spf)
+            spf.flush()
+            os.fsync(spf.fileno())
+        os.replace(tmp_file, file)
+
+
+async def async_persist_session_token(
+    hass: HomeAssistant, entry: ConfigEntry, session_token: str
+) -> None:
+    """Persist the session token, skipping the write if it hasn't changed."""
+    token_cache = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_TOKEN_CACHE, {})
+    if token_cache.get(entry.entry_id) == session_token:
+        return
+    await hass.async_add_executor_job(persist_session_token, hass, entry, session_token)
+    token_cache[entry.entry_id] = session_token
+
+
+def pop_pending_client(
+    hass: HomeAssistant, session_token: str
+) -> Optional[ChargePoint]:
+    """Take the client the config flow logged in with, if it's still fresh."""
+    pending = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_PENDING_CLIENTS, {})
+    now = monotonic()
+    expired = [t for t, (_, ts) in pending.items() if now - ts > CREDENTIAL_CACHE_TTL]
+    for token in expired:
+        stale_client, _ = pending.pop(token)
+        stale_client.session.close()
+    client, _ = pending.pop(session_token, (None, None))
+    return client
 
 
 def retrieve_session_token(hass: HomeAssistant, entry: ConfigEntry) -> Optional[str]:
@@ -86,6 +209,52 @@ def retrieve_session_token(hass: HomeAssistant, entry: ConfigEntry) -> Optional[
                 return
 
 
+def fetch_home_charger(
+    client: ChargePoint, charger_id: int
+) -> Tuple[HomeChargerStatus, HomeChargerTechnicalInfo]:
+    """Fetch a home charger's status and technical info in a single executor job."""
+    return (
+        client.get_home_charger_status(charger_id),
+        client.get_home_charger_technical_info(charger_id),
+    )
+
+
+def raise_gathered_exception(results: list) -> None:
+    """Re-raise the most relevant exception from asyncio.gather results.
+
+    An invalid session takes precedence so the caller can re-login.
+    """
+    errors = [result for result in results if isinstance(result, BaseException)]
+    for error in errors:
+        if isinstance(error, ChargePointInvalidSession):
+            raise error
+    if errors:
+        raise errors[0]
+
+
+def get_poll_interval(entry: ConfigEntry, data: Optional[dict] = None) -> timedelta:
+    """Return the polling interval for the entry's options and latest data.
+
+    With adaptive polling enabled, ChargePoint is polled less often while
+    nothing is plugged in or charging.
+    """
+    # Clamp the interval so a bad option can't hammer the API or stall polling.
+    seconds = max(
+        POLL_INTERVAL_MIN,
+        min(
+            POLL_INTERVAL_MAX,
+            int(entry.options.get(OPTION_POLL_INTERVAL, POLL_INTERVAL_DEFAULT)),
+        ),
+    )
+    if data is not None and entry.options.get(OPTION_ADAPTIVE_POLLING, False):
+        active = data[ACCT_CRG_STATUS] is not None or any(
+            status.plugged_in for status, _, _ in data[ACCT_HOME_CRGS].values()
+        )
+        if not active:
+            seconds = max(seconds, POLL_INTERVAL_IDLE)
+    return timedelta(seconds=seconds)
+
+
 async def async_setup(hass: HomeAssistant, entry: ConfigEntry):
     """Disallow configuration via YAML"""
 
@@ -105,23 +274,64 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     token_from_disk = await hass.async_add_executor_job(
         retrieve_session_token, hass, entry
     )
+    if token_from_disk:
+        # Seed the cache so an unchanged token isn't written straight back.
+        token_cache = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_TOKEN_CACHE, {})
+        token_cache[entry.entry_id] = token_from_disk
     session_token = token_from_disk or current_token
 
+    hass.data.setdefault(DOMAIN, {})
+    # Keep ChargePoint's blocking I/O off Home Assistant's shared executor.
+    executor = ThreadPoolExecutor(
+        max_workers=EXECUTOR_MAX_WORKERS, thread_name_prefix=DOMAIN
+    )
+    entry.async_on_unload(lambda: executor.shutdown(wait=False))
+    single_flight = SingleFlight()
+    limiter = RateLimiter(API_MAX_RATE, API_RATE_PERIOD)
+
+    async def async_executor_call(func: Callable, *args: Any) -> Any:
+        """Run a blocking client call in the executor, rate limited and retried."""
+        for attempt in range(API_RETRY_ATTEMPTS):
+            try:
+                async with limiter, asyncio.timeout(API_TIMEOUT):
+                    return await hass.loop.run_in_executor(executor, func, *args)
+            except (ChargePointInvalidSession, ChargePointLoginError):
+                raise
+            except ChargePointCommunicationException:
+                if attempt == API_RETRY_ATTEMPTS - 1:
+                    raise
+                delay = 2**attempt
+                _LOGGER.debug(
+                    "ChargePoint call %s failed, retrying in %d seconds",
+                    func.__name__,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+    # A freshly configured entry can reuse the client the config flow logged in with.
+    client: Optional[ChargePoint] = pop_pending_client(hass, session_token)
+
     try:
-        client: ChargePoint = await hass.async_add_executor_job(
-            ChargePoint, username, password, session_token
-        )
-        await hass.async_add_executor_job(
-            persist_session_token, hass, entry, client.session_token
-        )
+        if client is None:
+            client = await async_executor_call(
+                ChargePoint, username, password, session_token
+            )
+        await async_persist_session_token(hass, entry, client.session_token)
     except ChargePointLoginError as exc:
         _LOGGER.error("Failed to authenticate to ChargePoint")
         raise ConfigEntryAuthFailed from exc
     except ChargePointBaseException as exc:
         _LOGGER.error("Unknown ChargePoint Error!")
         raise ConfigEntryNotReady from exc
+    except TimeoutError as exc:
+        _LOGGER.error("Timed out connecting to ChargePoint")
+        raise ConfigEntryNotReady from exc
 
-    hass.data.setdefault(DOMAIN, {})
+    async def async_client_call(func: Callable, *args: Any) -> Any:
+        """Run a client call through the executor, sharing duplicate calls."""
+        return await single_flight.call(
+            (func.__name__, args), lambda: async_executor_call(func, *args)
+        )
 
     async def async_update_data(is_retry: bool = False):
         """Fetch data from ChargePoint API"""
@@ -132,61 +342,81 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             ACCT_HOME_CRGS: {},
         }
         try:
-            account: ChargePointAccount = await hass.async_add_executor_job(
-                client.get_account
+            # The account, charging status and charger list are independent of
+            # each other, only the session lookup depends on the charging status.
+            results = await asyncio.gather(
+                async_client_call(client.get_account),
+                async_client_call(client.get_user_charging_status),
+                async_client_call(client.get_home_chargers),
+                return_exceptions=True,
             )
+            raise_gathered_exception(results)
+            account, crg_status, home_chargers = results
             data[ACCT_INFO] = account
-
-            crg_status: Optional[
-                UserChargingStatus
-            ] = await hass.async_add_executor_job(client.get_user_charging_status)
             data[ACCT_CRG_STATUS] = crg_status
 
             if crg_status:
-                crg_session: ChargingSession = await hass.async_add_executor_job(
+                crg_session: ChargingSession = await async_client_call(
                     client.get_charging_session, crg_status.session_id
                 )
                 data[ACCT_SESSION] = crg_session
 
-            home_chargers: list = await hass.async_add_executor_job(
-                client.get_home_chargers
+            # One executor job per charger, with the chargers fetched concurrently.
+            results = await asyncio.gather(
+                *[
+                    async_client_call(fetch_home_charger, client, charger)
+                    for charger in home_chargers
+                ],
+                return_exceptions=True,
             )
-            for charger in home_chargers:
-                hcrg_status: HomeChargerStatus = await hass.async_add_executor_job(
-                    client.get_home_charger_status, charger
+            raise_gathered_exception(results)
+            for charger, (hcrg_status, hcrg_tech_info) in zip(home_chargers, results):
+                data[ACCT_HOME_CRGS][charger] = (
+                    hcrg_status,
+                    hcrg_tech_info,
+                    derive_charger_info(
+                        hcrg_status.brand,
+                        hcrg_status.model,
+                        tuple(hcrg_status.possible_amperage_limits),
+                    ),
                 )
-                hcrg_tech_info: HomeChargerTechnicalInfo = (
-                    await hass.async_add_executor_job(
-                        client.get_home_charger_technical_info, charger
-                    )
-                )
-                data[ACCT_HOME_CRGS][charger] = (hcrg_status, hcrg_tech_info)
 
+            coordinator.update_interval = get_poll_interval(entry, data)
             return data
         except ChargePointInvalidSession:
             if not is_retry:
                 _LOGGER.warning(
                     "ChargePoint Session Token is invalid, attempting to re-login"
                 )
-                await hass.async_add_executor_job(client.login, username, password)
-                persist_session_token(hass, entry, client.session_token)
+                try:
+                    await async_executor_call(client.login, username, password)
+                except ChargePointLoginError as err:
+                    # The stored password no longer works, ask the user for it.
+                    _LOGGER.error("Failed to re-authenticate to ChargePoint")
+                    raise ConfigEntryAuthFailed from err
+                await async_persist_session_token(hass, entry, client.session_token)
                 return await async_update_data(is_retry=True)
             raise
         except ChargePointCommunicationException as err:
             _LOGGER.error("Failed to update ChargePoint State")
             raise UpdateFailed from err
+        except TimeoutError as err:
+            _LOGGER.error("Timed out updating ChargePoint State")
+            raise UpdateFailed("Timed out waiting for ChargePoint") from err
 
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
         name=DOMAIN,
         update_method=async_update_data,
-        update_interval=timedelta(minutes=3),
+        update_interval=get_poll_interval(entry),
     )
 
     hass.data[DOMAIN][entry.entry_id] = {
         DATA_CLIENT: client,
         DATA_COORDINATOR: coordinator,
+        DATA_EXECUTOR: executor,
+        DATA_LIMITER: limiter,
     }
 
     # Fetch initial data so we have data when entities subscribe
@@ -195,9 +425,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     # Setup components
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options, only reloading the entry if the credentials changed."""
+    username = entry.options.get(CONF_USERNAME, entry.data[CONF_USERNAME])
+    password = entry.options.get(CONF_PASSWORD, entry.data[CONF_PASSWORD])
+    if (username, password) != (entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD]):
+        # Setup logs in with the entry data and the token file, so the new
+        # credentials and their token have to land in both before reloading.
+        session_token = entry.options[CONF_ACCESS_TOKEN]
+        await async_persist_session_token(hass, entry, session_token)
+        hass.config_entries.async_update_entry(
+            entry,
+            data={
+                **entry.data,
+                CONF_USERNAME: username,
+                CONF_PASSWORD: password,
+                CONF_ACCESS_TOKEN: session_token,
+            },
+        )
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    entry_data = hass.data[DOMAIN].get(entry.entry_id)
+    if entry_data is None:
+        # The entry is reloading, setup will pick up the new options.
+        return
+    # Polling changes only need the coordinator rescheduled.
+    coordinator = entry_data[DATA_COORDINATOR]
+    coordinator.update_interval = get_poll_interval(entry, coordinator.data)
+    coordinator.async_set_updated_data(coordinator.data)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -230,6 +493,10 @@ class ChargePointEntity(CoordinatorEntity):
 class ChargePointChargerEntity(CoordinatorEntity):
     """Base ChargePoint Entity"""
 
+    # Every entity of a charger shares the same DeviceInfo, keyed by the
+    # charger and its firmware version so an update produces a fresh one.
+    _device_info_cache: Dict[Tuple[int, str], DeviceInfo] = {}
+
     def __init__(
         self, client: ChargePoint, coordinator: DataUpdateCoordinator, charger_id: int
     ):
@@ -237,43 +504,98 @@ class ChargePointChargerEntity(CoordinatorEntity):
         super().__init__(coordinator)
         self.client = client
         self.charger_id = charger_id
-        self.manufacturer = (
-            "ChargePoint"
-            if self.charger_status.brand == "CP"
-            else self.charger_status.brand
+        self._charger_status: HomeChargerStatus
+        self._technical_info: HomeChargerTechnicalInfo
+        self._derived_info: ChargerDerivedInfo
+        self._session: Optional[ChargingSession] = None
+        self._cache_charger_data()
+        self.manufacturer = self._derived_info.manufacturer
+        self.short_charger_model = self._derived_info.short_model
+
+        self._attr_device_info = self._get_device_info(
+            charger_id, self.charger_status, self.technical_info, self._derived_info
         )
-        self.short_charger_model = self.charger_status.model.split("-")[0]
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, str(self.charger_id))},
-            manufacturer=self.manufacturer,
-            model=self.charger_status.model,
-            name=f"{self.manufacturer} Home Flex ({self.short_charger_model})"
-            if "CPH" in self.short_charger_model
-            else f"{self.manufacturer} {self.short_charger_model}",
-            sw_version=self.technical_info.software_version,
+
+    @classmethod
+    def _get_device_info(
+        cls,
+        charger_id: int,
+        charger_status: HomeChargerStatus,
+        technical_info: HomeChargerTechnicalInfo,
+        derived_info: ChargerDerivedInfo,
+    ) -> DeviceInfo:
+        """Return the shared DeviceInfo for a charger, building it on first use."""
+        key = (charger_id, technical_info.software_version)
+        device_info = cls._device_info_cache.get(key)
+        if device_info is None:
+            device_info = cls._device_info_cache[key] = DeviceInfo(
+                identifiers={(DOMAIN, str(charger_id))},
+                manufacturer=derived_info.manufacturer,
+                model=charger_status.model,
+                name=derived_info.device_name,
+                sw_version=technical_info.software_version,
+            )
+        return device_info
+
+    def _set_name_and_unique_id(self, description: EntityDescription) -> None:
+        """Set the entity name and unique ID, reusing strings from earlier setups."""
+        key = (self.charger_id, self.short_charger_model, description.key)
+        names = ENTITY_NAME_CACHE.get(key)
+        if names is None:
+            # Interned, as the registries hash and compare these on every lookup.
+            names = ENTITY_NAME_CACHE[key] = (
+                sys.intern(f"{self.short_charger_model} {description.name_suffix}"),
+                sys.intern(f"{self.charger_id}_{description.key}"),
+            )
+        self._attr_name, self._attr_unique_id = names
+
+    def _cache_charger_data(self) -> None:
+        """Keep references to this charger's data from the latest refresh."""
+        charger_data = self.coordinator.data[ACCT_HOME_CRGS].get(self.charger_id)
+        if charger_data:
+            (
+                self._charger_status,
+                self._technical_info,
+                self._derived_info,
+            ) = charger_data
+        session: Optional[ChargingSession] = self.coordinator.data[ACCT_SESSION]
+        self._session = (
+            session if session and session.device_id == self.charger_id else None
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached charger data before writing the new state."""
+        self._cache_charger_data()
+        super()._handle_coordinator_update()
+
+    async def async_executor_job(self, func: Callable, *args: Any) -> Any:
+        """Run a blocking client call on this entry's executor, rate limited."""
+        entry_data = self.hass.data[DOMAIN][self.coordinator.config_entry.entry_id]
+        async with entry_data[DATA_LIMITER]:
+            return await self.hass.loop.run_in_executor(
+                entry_data[DATA_EXECUTOR], func, *args
+            )
+
     @property
     def charger_status(self) -> HomeChargerStatus:
-        return self.coordinator.data[ACCT_HOME_CRGS][self.charger_id][0]
+        return self._charger_status
 
     @property
     def technical_info(self) -> HomeChargerTechnicalInfo:
-        return self.coordinator.data[ACCT_HOME_CRGS][self.charger_id][1]
+        return self._technical_info
 
     @property
     def session(self) -> Optional[ChargingSession]:
-        session: ChargingSession = self.coordinator.data[ACCT_SESSION]
-        if session and session.device_id == self.charger_id:
-            return self.coordinator.data[ACCT_SESSION]
+        return self._session
 
     @session.setter
     def session(self, new_session: Optional[ChargingSession]):
         self.coordinator.data[ACCT_SESSION] = new_session
+        self._session = new_session
 
 
-@dataclass
+@dataclass(frozen=True)
 class ChargePointEntityRequiredKeysMixin:
     """Mixin for required keys on all entities."""
 
@@ -1,7 +1,8 @@
 """Adds config flow for ChargePoint."""
+import hashlib
 import logging
-from collections import OrderedDict
-from typing import Any, Dict, Optional
+from time import monotonic
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -14,20 +15,70 @@ from python_chargepoint.exceptions import (
     ChargePointCommunicationException,
 )
 
-from .const import DOMAIN
+from . import async_persist_session_token
+from .const import (
+    DOMAIN,
+    DATA_CLIENT,
+    DATA_PENDING_CLIENTS,
+    CREDENTIAL_CACHE_TTL,
+    OPTION_POLL_INTERVAL,
+    OPTION_ADAPTIVE_POLLING,
+    POLL_INTERVAL_DEFAULT,
+    POLL_INTERVAL_MIN,
+    POLL_INTERVAL_MAX,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# The login form never changes, so it's only built once.
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required("username", default="", description="Username"): str,
+        vol.Required("password", default="", description="Password"): str,
+    }
+)
+# Password field shared by the reauth and options forms.
+_PASSWORD_FIELD = vol.Required("password", default="")
+REAUTH_SCHEMA = vol.Schema({_PASSWORD_FIELD: str})
+POLL_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Clamp(min=POLL_INTERVAL_MIN, max=POLL_INTERVAL_MAX)
+)
+
+# Session tokens from recent logins, keyed by username and password hash.
+_CREDENTIAL_CACHE: Dict[Tuple[str, bytes], Tuple[str, float]] = {}
+
+
+def _credential_key(username: str, password: str) -> Tuple[str, bytes]:
+    return username, hashlib.sha256(password.encode()).digest()
+
+
+def _cached_session_token(key: Tuple[str, bytes]) -> Optional[str]:
+    """Return a recently obtained token for the credentials, dropping expired ones."""
+    now = monotonic()
+    expired = [
+        k for k, (_, ts) in _CREDENTIAL_CACHE.items() if now - ts > CREDENTIAL_CACHE_TTL
+    ]
+    for stale in expired:
+        del _CREDENTIAL_CACHE[stale]
+    cached = _CREDENTIAL_CACHE.get(key)
+    return cached[0] if cached else None
+
 
 class ChargePointBaseFlowHandler(config_entries.ConfigFlow):
     async def _test_credentials(self, username, password) -> Optional[str]:
         """Return true if credentials is valid."""
+        key = _credential_key(username, password)
+        session_token = _cached_session_token(key)
+        if session_token:
+            return session_token
         try:
-            _LOGGER.info("Attempting to authenticate with chargepoint")
+            _LOGGER.debug("Authenticating with ChargePoint")
             client = await self.hass.async_add_executor_job(
                 ChargePoint, username, password
             )
+            _CREDENTIAL_CACHE[key] = (client.session_token, monotonic())
+            self._client = client
             return client.session_token
         except ChargePointLoginError:
             return
@@ -51,6 +102,8 @@ class ChargePointFlowHandler(ChargePointBaseFlowHandler, domain=DOMAIN):
         """Initialize."""
         self._data = {}
         self._errors = {}
+        self._client: Optional[ChargePoint] = None
+        self._reauth_entry: Optional[config_entries.ConfigEntry] = None
 
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
@@ -66,6 +119,7 @@ class ChargePointFlowHandler(ChargePointBaseFlowHandler, domain=DOMAIN):
             )
             if session_token:
                 user_input[CONF_ACCESS_TOKEN] = session_token
+                self._hand_off_client(session_token)
                 return self.async_create_entry(
                     title=user_input[CONF_USERNAME], data=user_input
                 )
@@ -76,21 +130,73 @@ class ChargePointFlowHandler(ChargePointBaseFlowHandler, domain=DOMAIN):
 
         return await self._show_config_form(user_input)
 
+    def _hand_off_client(self, session_token: str) -> None:
+        """Leave the logged in client for the new entry's setup to pick up."""
+        # Setup looks the client up by the token stored in the new entry.
+        if self._client and self._client.session_token == session_token:
+            pending = self.hass.data.setdefault(DOMAIN, {}).setdefault(
+                DATA_PENDING_CLIENTS, {}
+            )
+            pending[session_token] = (self._client, monotonic())
+        self._client = None
+
     async def _show_config_form(self, user_input):
         """Show the configuration form to edit creds."""
-        if not user_input:
-            user_input = {}
+        return self.async_show_form(
+            step_id="user",
+            data_schema=USER_SCHEMA,
+            errors=self._errors,
+        )
+
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> Dict[str, Any]:
+        """Handle a reauth request after the stored credentials were rejected."""
+        self._reauth_entry = self.hass.config_entries.async_get_entry(
+            self.context["entry_id"]
+        )
+        return await self.async_step_reauth_confirm()
 
-        data_schema = OrderedDict()
-        data_schema[vol.Required("username", default="", description="Username")] = str
-        data_schema[vol.Required("password", default="", description="Password")] = str
+    async def async_step_reauth_confirm(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Ask for the password and log in with it."""
+        self._errors = {}
+        entry = self._reauth_entry
+        username = entry.data[CONF_USERNAME]
+
+        if user_input is not None:
+            session_token = await self._test_credentials(
+                username, user_input[CONF_PASSWORD]
+            )
+            if session_token:
+                return await self._async_finish_reauth(
+                    entry, user_input[CONF_PASSWORD], session_token
+                )
+            self._errors["base"] = "invalid_credentials"
 
         return self.async_show_form(
-            step_id="user",
-            data_schema=vol.Schema(data_schema),
+            step_id="reauth_confirm",
+            data_schema=REAUTH_SCHEMA,
+            description_placeholders={"username": username},
             errors=self._errors,
         )
 
+    async def _async_finish_reauth(
+        self, entry: config_entries.ConfigEntry, password: str, session_token: str
+    ) -> Dict[str, Any]:
+        """Store the working credentials and reload the entry."""
+        # Setup reads the token file first, so it must not hold a stale token.
+        await async_persist_session_token(self.hass, entry, session_token)
+        self.hass.config_entries.async_update_entry(
+            entry,
+            data={
+                **entry.data,
+                CONF_PASSWORD: password,
+                CONF_ACCESS_TOKEN: session_token,
+            },
+        )
+        await self.hass.config_entries.async_reload(entry.entry_id)
+        return self.async_abort(reason="reauth_successful")
+
 
 class OptionsFlowHandler(ChargePointBaseFlowHandler, config_entries.OptionsFlow):
     def __init__(self, config_entry):
@@ -98,6 +204,7 @@ class OptionsFlowHandler(ChargePointBaseFlowHandler, config_entries.OptionsFlow)
         self.config_entry = config_entry
         self.options = dict(config_entry.options)
         self._errors = {}
+        self._client: Optional[ChargePoint] = None
         self._data = {}
 
     async def async_step_init(self, user_input=None):
@@ -108,21 +215,49 @@ class OptionsFlowHandler(ChargePointBaseFlowHandler, config_entries.OptionsFlow)
             self._data = user_input
             return await self._update_options()
 
-        data_schema = OrderedDict()
-        data_schema[
-            vol.Required("username", default=self.config_entry.data.get(CONF_USERNAME))
-        ] = str
-        data_schema[vol.Required("password", default="")] = str
+        # Extending USER_SCHEMA would move the username below the password, so
+        # only the shared password field is reused.
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    "username", default=self.config_entry.data.get(CONF_USERNAME)
+                ): str,
+                _PASSWORD_FIELD: str,
+                vol.Optional(
+                    OPTION_POLL_INTERVAL,
+                    default=self.options.get(
+                        OPTION_POLL_INTERVAL, POLL_INTERVAL_DEFAULT
+                    ),
+                ): POLL_INTERVAL_VALIDATOR,
+                vol.Optional(
+                    OPTION_ADAPTIVE_POLLING,
+                    default=self.options.get(OPTION_ADAPTIVE_POLLING, False),
+                ): bool,
+            }
+        )
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(data_schema),
+            data_schema=data_schema,
             errors=self._errors,
         )
 
+    def _running_session_token(self) -> Optional[str]:
+        """Return the loaded client's token if the credentials are unchanged."""
+        data = self.config_entry.data
+        if (
+            self._data[CONF_USERNAME] != data.get(CONF_USERNAME)
+            or self._data[CONF_PASSWORD] != data.get(CONF_PASSWORD)
+        ):
+            return None
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        client = entry_data.get(DATA_CLIENT) if entry_data else None
+        return client.session_token if client else None
+
     async def _update_options(self):
         """Update config entry options."""
-        session_token = await self._test_credentials(
+        # Re-entering the same credentials doesn't need another login.
+        session_token = self._running_session_token() or await self._test_credentials(
             self._data[CONF_USERNAME],
             self._data[CONF_PASSWORD],
         )
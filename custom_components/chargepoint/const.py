@@ -6,7 +6,7 @@ from homeassistant.const import Platform
 NAME = "ChargePoint"
 DOMAIN = "chargepoint"
 DOMAIN_DATA = f"{DOMAIN}_data"
-VERSION = "0.6.0"
+VERSION = "0.8.0"
 ATTRIBUTION = "Data provided by https://www.chargepoint.com"
 ISSUE_URL = "https://github.com/mbillow/ha-chargepoint/issues"
 
@@ -18,9 +18,31 @@ PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.SELECT]
 CONF_ENABLED = "enabled"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
+OPTION_POLL_INTERVAL = "poll_interval"
+OPTION_ADAPTIVE_POLLING = "adaptive_polling"
+
+# Polling interval bounds, in seconds
+POLL_INTERVAL_DEFAULT = 180
+POLL_INTERVAL_MIN = 60
+POLL_INTERVAL_MAX = 3600
+POLL_INTERVAL_IDLE = 300
+
+# API throttling and retries
+API_MAX_RATE = 8
+API_RATE_PERIOD = 1
+API_RETRY_ATTEMPTS = 3
+API_TIMEOUT = 30
+EXECUTOR_MAX_WORKERS = 4
+
+# Seconds a session token from the config flow is reused for the same login
+CREDENTIAL_CACHE_TTL = 300
 
 TOKEN_FILE_NAME = "chargepoint_session.json"
 CHARGER_SESSION_STATE_IN_USE = "IN_USE"
+EXCEPTION_WARNING_MSG = (
+    "ChargePoint returned an exception, you might want to "
+    "double check the charging status in the app."
+)
 
 # Account Data
 ACCT_INFO = "account_information"
@@ -32,6 +54,10 @@ ACCT_HOME_CRGS = "home_chargers"
 DATA_CLIENT = "chargepoint_client"
 DATA_COORDINATOR = "coordinator"
 DATA_CHARGERS = "home_chargers"
+DATA_TOKEN_CACHE = "token_cache"
+DATA_EXECUTOR = "executor"
+DATA_LIMITER = "limiter"
+DATA_PENDING_CLIENTS = "pending_clients"
 
 # Defaults
 DEFAULT_NAME = "chargepoint"
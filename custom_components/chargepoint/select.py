@@ -1,6 +1,6 @@
 import logging
-from datetime import datetime
-from typing import List, Tuple, Type
+from dataclasses import dataclass
+from typing import Tuple, Type
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -23,8 +23,7 @@ from .const import (
 )
 
 _LOGGER = logging.getLogger(__name__)
-EXCEPTION_WARNING_MSG = "ChargePoint returned an exception, you might want to " + \
-                        "double check the amperage in the app."
+
 
 class ChargePointChargerSelectEntity(SelectEntity, ChargePointChargerEntity):
     """Representation of a ChargePoint Charger Device Select."""
@@ -36,8 +35,7 @@ class ChargePointChargerSelectEntity(SelectEntity, ChargePointChargerEntity):
         self.hass = hass
         self.entity_description = description
 
-        self._attr_name = f"{self.short_charger_model} {description.name_suffix}"
-        self._attr_unique_id = f"{charger_id}_{description.key}"
+        self._set_name_and_unique_id(description)
 
     async def async_select_option(self, option: str) -> None:
         pass
@@ -48,7 +46,7 @@ class ChargePointChargerChargeLimitSelectEntity(ChargePointChargerSelectEntity):
 
     def __init__(self, hass, client, coordinator, description, charger_id):
         super().__init__(hass, client, coordinator, description, charger_id)
-        self._attr_options = [str(v) for v in self.charger_status.possible_amperage_limits]
+        self._attr_options = list(self._derived_info.amperage_options)
         self._attr_current_option = str(self.charger_status.amperage_limit)
 
     async def async_select_option(self, option: str) -> None:
@@ -57,13 +55,16 @@ class ChargePointChargerChargeLimitSelectEntity(ChargePointChargerSelectEntity):
             raise HomeAssistantError("Cannot set amperage if charger not plugged in!")
 
         try:
-            _LOGGER.warn(
-                "Setting new ChargePoint amperage on Device ID: %s to %d", self.charger_id, int(option)
+            _LOGGER.info(
+                "Setting new ChargePoint amperage on Device ID: %s to %d",
+                self.charger_id,
+                int(option),
             )
-            await self.hass.async_add_executor_job(
-                self.client.set_amperage_limit, self.charger_id, int(option),
+            await self.async_executor_job(
+                self.client.set_amperage_limit, self.charger_id, int(option)
             )
             self._attr_current_option = option
+            self.async_write_ha_state()
         except ChargePointCommunicationException:
             _LOGGER.exception("Cannot set new amperage limit")
             raise HomeAssistantError("Cannot set new amperage limit!")
@@ -71,21 +72,19 @@ class ChargePointChargerChargeLimitSelectEntity(ChargePointChargerSelectEntity):
         await self.coordinator.async_request_refresh()
 
 
+@dataclass(frozen=True)
 class ChargePointChargerSelectEntityDescription(
     SelectEntityDescription, ChargePointEntityRequiredKeysMixin
 ):
     """Select entity description with required fields"""
 
-    def __init__(self, **kwargs) -> None:
-        self.name_suffix = kwargs.pop("name_suffix")
-        super().__init__(**kwargs)
-
 
-CHARGER_SELECTS: List[
+CHARGER_SELECTS: Tuple[
     Tuple[
         Type[ChargePointChargerSelectEntity], ChargePointChargerSelectEntityDescription
-    ]
-] = [
+    ],
+    ...,
+] = (
     (
         ChargePointChargerChargeLimitSelectEntity,
         ChargePointChargerSelectEntityDescription(
@@ -94,8 +93,8 @@ CHARGER_SELECTS: List[
             unit_of_measurement=UnitOfElectricCurrent.AMPERE,
             icon="mdi:lightning-bolt",
         ),
-    )
-]
+    ),
+)
 
 
 async def async_setup_entry(
@@ -105,15 +104,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up the selects."""
 
-    client = hass.data[DOMAIN][config_entry.entry_id][DATA_CLIENT]
-    coordinator = hass.data[DOMAIN][config_entry.entry_id][DATA_COORDINATOR]
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    client = entry_data[DATA_CLIENT]
+    coordinator = entry_data[DATA_COORDINATOR]
+    charger_ids = tuple(coordinator.data[ACCT_HOME_CRGS])
 
-    entities: list[SelectEntity] = []
-
-    for charger_id in coordinator.data[ACCT_HOME_CRGS].keys():
-        for select_class, description in CHARGER_SELECTS:
-            entities.append(
-                select_class(hass, client, coordinator, description, charger_id)
-            )
-
-    async_add_entities(entities)
+    async_add_entities(
+        select_class(hass, client, coordinator, description, charger_id)
+        for charger_id in charger_ids
+        for select_class, description in CHARGER_SELECTS
+    )
@@ -1,7 +1,8 @@
 """Sensor platform for ChargePoint."""
 import logging
+import sys
 from dataclasses import dataclass
-from typing import Callable, Optional, Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -10,7 +11,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTime
+from homeassistant.const import UnitOfEnergy, UnitOfPower, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
@@ -25,8 +26,27 @@ from .const import DATA_CLIENT, DATA_COORDINATOR, DOMAIN, ACCT_HOME_CRGS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fixed sensor states and units, indexed by the boolean they describe where paired
+PLUGGED_IN_STATES = (sys.intern("Unplugged"), sys.intern("Plugged In"))
+CONNECTED_STATES = (sys.intern("Disconnected"), sys.intern("Connected"))
+NOT_CHARGING = sys.intern("Not Charging")
+UNIT_MILES = sys.intern("miles")
+UNIT_MILES_PER_HOUR = sys.intern("mph")
 
-@dataclass
+# Display strings for enum-like API values, formatted once per distinct value
+_STATUS_DISPLAY: Dict[str, str] = {}
+
+
+def display_status(raw_status) -> str:
+    """Turn an API status like "NOT_CHARGING" into "Not Charging"."""
+    raw_status = str(raw_status)
+    display = _STATUS_DISPLAY.get(raw_status)
+    if display is None:
+        display = _STATUS_DISPLAY[raw_status] = raw_status.replace("_", " ").title()
+    return display
+
+
+@dataclass(frozen=True)
 class ChargePointSensorRequiredKeysMixin:
     """Mixin for required keys."""
 
@@ -36,7 +56,7 @@ class ChargePointSensorRequiredKeysMixin:
     ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class ChargePointSensorEntityDescription(
     SensorEntityDescription,
     ChargePointEntityRequiredKeysMixin,
@@ -90,8 +110,7 @@ class ChargePointChargerSensorEntity(SensorEntity, ChargePointChargerEntity):
         super().__init__(client, coordinator, charger_id)
         self.entity_description = description
 
-        self._attr_name = f"{self.short_charger_model} {description.name_suffix}"
-        self._attr_unique_id = f"{charger_id}_{description.key}"
+        self._set_name_and_unique_id(description)
 
     @property
     def native_unit_of_measurement(self):
@@ -106,7 +125,7 @@ class ChargePointChargerSensorEntity(SensorEntity, ChargePointChargerEntity):
         return self.entity_description.value(self)
 
 
-ACCOUNT_SENSORS = [
+ACCOUNT_SENSORS: Tuple[ChargePointSensorEntityDescription, ...] = (
     ChargePointSensorEntityDescription(
         key="account_balance",
         name_suffix="Account Balance",
@@ -116,32 +135,30 @@ ACCOUNT_SENSORS = [
         state_class=SensorStateClass.TOTAL,
         value=lambda entity: f"{float(entity.account.account_balance.amount):.2f}",
     ),
-]
+)
 
-CHARGER_SENSORS = [
+CHARGER_SENSORS: Tuple[ChargePointSensorEntityDescription, ...] = (
     ChargePointSensorEntityDescription(
         key="charging_status",
         name_suffix="Charging Status",
         icon="mdi:lightning-bolt",
-        value=lambda entity: str(entity.charger_status.charging_status)
-        .replace("_", " ")
-        .title(),
+        value=lambda entity: display_status(entity.charger_status.charging_status),
     ),
     ChargePointSensorEntityDescription(
         key="plugged_in",
         name_suffix="Charging Cable",
         icon="mdi:power-plug",
-        value=lambda entity: "Plugged In"
-        if entity.charger_status.plugged_in
-        else "Unplugged",
+        value=lambda entity: PLUGGED_IN_STATES[
+            bool(entity.charger_status.plugged_in)
+        ],
     ),
     ChargePointSensorEntityDescription(
         key="connected",
         name_suffix="Network",
         icon="mdi:wifi",
-        value=lambda entity: "Connected"
-        if entity.charger_status.connected
-        else "Disconnected",
+        value=lambda entity: CONNECTED_STATES[
+            bool(entity.charger_status.connected)
+        ],
     ),
 # Problem with ChargePoint API?  Disabling per https://github.com/mbillow/ha-chargepoint/issues/33
 #    ChargePointSensorEntityDescription(
@@ -155,11 +172,9 @@ CHARGER_SENSORS = [
         key="session_charging_state",
         name_suffix="Charger State",
         icon="mdi:battery-charging",
-        value=lambda entity: str(entity.session.charging_state)
-        .replace("_", " ")
-        .title()
+        value=lambda entity: display_status(entity.session.charging_state)
         if entity.session
-        else "Not Charging",
+        else NOT_CHARGING,
     ),
     ChargePointSensorEntityDescription(
         key="session_charging_time",
@@ -178,7 +193,7 @@ CHARGER_SENSORS = [
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         value=lambda entity: round(entity.session.power_kw, 2) if entity.session else 0,
-        native_unit_of_measurement="kW",
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
     ),
     ChargePointSensorEntityDescription(
         key="session_energy_kwh",
@@ -189,7 +204,7 @@ CHARGER_SENSORS = [
         value=lambda entity: round(entity.session.energy_kwh, 2)
         if entity.session
         else 0,
-        native_unit_of_measurement="kWh",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
     ),
     ChargePointSensorEntityDescription(
         key="session_miles_added",
@@ -199,7 +214,7 @@ CHARGER_SENSORS = [
         value=lambda entity: round(entity.session.miles_added, 2)
         if entity.session
         else 0,
-        native_unit_of_measurement="miles",
+        native_unit_of_measurement=UNIT_MILES,
     ),
     ChargePointSensorEntityDescription(
         key="session_miles_added_per_hour",
@@ -209,7 +224,7 @@ CHARGER_SENSORS = [
         value=lambda entity: round(entity.session.miles_added_per_hour, 2)
         if entity.session
         else 0,
-        native_unit_of_measurement="mph",
+        native_unit_of_measurement=UNIT_MILES_PER_HOUR,
     ),
     ChargePointSensorEntityDescription(
         key="session_cost",
@@ -222,7 +237,7 @@ CHARGER_SENSORS = [
         else "0.00",
         unit=lambda entity: entity.client.global_config.default_currency.symbol,
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -231,20 +246,18 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
-    client = hass.data[DOMAIN][config_entry.entry_id][DATA_CLIENT]
-    coordinator = hass.data[DOMAIN][config_entry.entry_id][DATA_COORDINATOR]
-
-    entities: list[SensorEntity] = []
-
-    for description in ACCOUNT_SENSORS:
-        entities.append(ChargePointSensorEntity(client, coordinator, description))
-
-    for charger_id in coordinator.data[ACCT_HOME_CRGS].keys():
-        for description in CHARGER_SENSORS:
-            entities.append(
-                ChargePointChargerSensorEntity(
-                    client, coordinator, description, charger_id
-                )
-            )
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    client = entry_data[DATA_CLIENT]
+    coordinator = entry_data[DATA_COORDINATOR]
+    charger_ids = tuple(coordinator.data[ACCT_HOME_CRGS])
+
+    entities: list[SensorEntity] = [
+        ChargePointSensorEntity(client, coordinator, description)
+        for description in ACCOUNT_SENSORS
+    ] + [
+        ChargePointChargerSensorEntity(client, coordinator, description, charger_id)
+        for charger_id in charger_ids
+        for description in CHARGER_SENSORS
+    ]
 
     async_add_entities(entities)
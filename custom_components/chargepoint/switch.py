@@ -1,6 +1,9 @@
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Any, List, Tuple, Type, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from time import monotonic_ns
+from typing import Any, Optional, Tuple, Type
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -21,11 +24,22 @@ from .const import (
     DOMAIN,
     ACCT_HOME_CRGS,
     CHARGER_SESSION_STATE_IN_USE,
+    EXCEPTION_WARNING_MSG,
 )
 
 _LOGGER = logging.getLogger(__name__)
-EXCEPTION_WARNING_MSG = "ChargePoint returned an exception, you might want to " + \
-                        "double check the charging status in the app."
+
+# Seconds a newly started session is assumed to be charging.
+SESSION_START_GRACE_PERIOD = 180
+SESSION_START_GRACE_PERIOD_NS = SESSION_START_GRACE_PERIOD * 1_000_000_000
+
+
+@lru_cache(maxsize=16)
+def is_in_use(charging_state: str) -> bool:
+    """Return true if a session's charging state means it is in use."""
+    # ChargePoint reports a handful of lowercase states, e.g. "in_use".
+    return charging_state.upper() == CHARGER_SESSION_STATE_IN_USE
+
 
 class ChargePointChargerSwitchEntity(SwitchEntity, ChargePointChargerEntity):
     """Representation of a ChargePoint Charger Device Switch."""
@@ -38,14 +52,7 @@ class ChargePointChargerSwitchEntity(SwitchEntity, ChargePointChargerEntity):
         self.hass = hass
         self.entity_description = description
 
-        self._attr_name = f"{self.short_charger_model} {description.name_suffix}"
-        self._attr_unique_id = f"{charger_id}_{description.key}"
-
-    def turn_on(self, **kwargs: Any) -> None:
-        pass
-
-    def turn_off(self, **kwargs: Any) -> None:
-        pass
+        self._set_name_and_unique_id(description)
 
 
 class ChargePointChargerChargingSessionSwitchEntity(ChargePointChargerSwitchEntity):
@@ -53,26 +60,27 @@ class ChargePointChargerChargingSessionSwitchEntity(ChargePointChargerSwitchEnti
 
     def __init__(self, hass, client, coordinator, description, charger_id):
         super().__init__(hass, client, coordinator, description, charger_id)
-        self.last_toggled_on: Optional[datetime] = None
+        self._assume_on_until_ns = 0
+        self._start_task: Optional[asyncio.Task] = None
+        self._stop_task: Optional[asyncio.Task] = None
 
     @property
     def is_on(self) -> bool | None:
-        if self.last_toggled_on is not None and (
-            (self.last_toggled_on + timedelta(minutes=3)) > datetime.now()
-        ):
+        if monotonic_ns() < self._assume_on_until_ns:
             # The ChargePoint session API is eventually consistent.
             # Let's just assume we started a session for a bit.
-            _LOGGER.warning(
-                "Charging state switch state checked within three minutes of "
-                "starting a new session, assuming charging."
-            )
             return True
         if self.session:
-            session_state = self.session.charging_state.upper()
-            return session_state == CHARGER_SESSION_STATE_IN_USE
+            return is_in_use(self.session.charging_state)
         return False
 
-    async def async_turn_on(self) -> None:
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        # Join a start that's already in flight rather than sending another one.
+        if self._start_task is None or self._start_task.done():
+            self._start_task = self.hass.async_create_task(self._async_start_session())
+        await asyncio.shield(self._start_task)
+
+    async def _async_start_session(self) -> None:
         if not self.charger_status.plugged_in:
             self._attr_is_on = False
             raise HomeAssistantError("Cannot start session if charger not plugged in!")
@@ -81,7 +89,7 @@ class ChargePointChargerChargingSessionSwitchEntity(ChargePointChargerSwitchEnti
             _LOGGER.info(
                 "Starting new ChargePoint Session on Device ID: %s", self.charger_id
             )
-            self.session = await self.hass.async_add_executor_job(
+            self.session = await self.async_executor_job(
                 self.client.start_charging_session, self.charger_id
             )
         except ChargePointCommunicationException:
@@ -91,42 +99,50 @@ class ChargePointChargerChargingSessionSwitchEntity(ChargePointChargerSwitchEnti
             # TODO: Maybe we should add some retry logic here just in case?
             _LOGGER.warning(EXCEPTION_WARNING_MSG)
 
-        self.last_toggled_on = datetime.now()
-        await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self) -> None:
+        self._assume_on_until_ns = monotonic_ns() + SESSION_START_GRACE_PERIOD_NS
+        _LOGGER.debug(
+            "Assuming Device ID %s is charging for the next %d seconds",
+            self.charger_id,
+            SESSION_START_GRACE_PERIOD,
+        )
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        # Join a stop that's already in flight; the session is gone once it ends.
+        if self._stop_task is None or self._stop_task.done():
+            self._stop_task = self.hass.async_create_task(self._async_stop_session())
+        await asyncio.shield(self._stop_task)
+
+    async def _async_stop_session(self) -> None:
         if not self.session:
             raise HomeAssistantError("Cannot stop a session that doesn't exist!")
-        session_state = self.session.charging_state.upper()
-        if session_state != CHARGER_SESSION_STATE_IN_USE:
+        if not is_in_use(self.session.charging_state):
             raise HomeAssistantError("You can't stop a session that hasn't started.")
 
         try:
             _LOGGER.info("Stopping ChargePoint Session: %s", self.session.session_id)
-            await self.hass.async_add_executor_job(self.session.stop)
+            await self.async_executor_job(self.session.stop)
         except ChargePointCommunicationException:
             _LOGGER.warning(EXCEPTION_WARNING_MSG)
 
         self.session = None
-        self.last_toggled_on = None
-        await self.coordinator.async_request_refresh()
+        self._assume_on_until_ns = 0
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
 
 
+@dataclass(frozen=True)
 class ChargePointChargerSwitchEntityDescription(
     SwitchEntityDescription, ChargePointEntityRequiredKeysMixin
 ):
     """Switch entity description with required fields"""
 
-    def __init__(self, **kwargs) -> None:
-        self.name_suffix = kwargs.pop("name_suffix")
-        super().__init__(**kwargs)
-
 
-CHARGER_SWITCHES: List[
+CHARGER_SWITCHES: Tuple[
     Tuple[
         Type[ChargePointChargerSwitchEntity], ChargePointChargerSwitchEntityDescription
-    ]
-] = [
+    ],
+    ...,
+] = (
     (
         ChargePointChargerChargingSessionSwitchEntity,
         ChargePointChargerSwitchEntityDescription(
@@ -135,8 +151,8 @@ CHARGER_SWITCHES: List[
             device_class=SwitchDeviceClass.SWITCH,
             icon="mdi:lightning-bolt",
         ),
-    )
-]
+    ),
+)
 
 
 async def async_setup_entry(
@@ -146,15 +162,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
 
-    client = hass.data[DOMAIN][config_entry.entry_id][DATA_CLIENT]
-    coordinator = hass.data[DOMAIN][config_entry.entry_id][DATA_COORDINATOR]
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    client = entry_data[DATA_CLIENT]
+    coordinator = entry_data[DATA_COORDINATOR]
+    charger_ids = tuple(coordinator.data[ACCT_HOME_CRGS])
 
-    entities: list[SwitchEntity] = []
-
-    for charger_id in coordinator.data[ACCT_HOME_CRGS].keys():
-        for switch_class, description in CHARGER_SWITCHES:
-            entities.append(
-                switch_class(hass, client, coordinator, description, charger_id)
-            )
-
-    async_add_entities(entities)
+    async_add_entities(
+        switch_class(hass, client, coordinator, description, charger_id)
+        for charger_id in charger_ids
+        for switch_class, description in CHARGER_SWITCHES
+    )